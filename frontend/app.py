@@ -5,28 +5,32 @@ Multi-step form interface for job seekers to find personalized job matches.
 """
 
 import streamlit as st
+import atexit
+import hashlib
+import html
+import queue
+import string
 import sys
+import threading
+import weakref
+from io import BytesIO
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-# Add project root directory to path for imports
-sys.path.append(str(Path(__file__).parent.parent))
+# Add project root directory to path for imports. Streamlit re-executes this
+# script on every rerun, so only add it once.
+PROJECT_ROOT = str(Path(__file__).resolve().parent.parent)
+if PROJECT_ROOT not in sys.path:
+    sys.path.append(PROJECT_ROOT)
 
-from src.utils.file_parser import extract_resume_text
-from src.utils.csv_storage import CandidateStorage
-from src.core.job_search_crew import JobSearchCrew
+# The src.* modules (CrewAI, LLM clients, PDF parsers) are imported inside the
+# functions/steps that use them, so the first form steps render without them.
+if TYPE_CHECKING:
+    from src.utils.csv_storage import CandidateStorage
 
 
-# Page configuration
-st.set_page_config(
-    page_title="AI Job Search Assistant",
-    page_icon="🎯",
-    layout="wide",
-    initial_sidebar_state="collapsed",
-)
-
-# Custom CSS
-st.markdown(
-    """
+# Static page markup - plain string constants, nothing is formatted per rerun
+CUSTOM_CSS = """
 <style>
     /* Add horizontal padding to main content area */
     .block-container {
@@ -55,7 +59,7 @@ st.markdown(
         color: #888;
         margin-bottom: 2rem;
     }
-    .stButton>button {
+    .stButton>button, .stFormSubmitButton>button {
         width: 100%;
         background-color: #1f77b4;
         color: white;
@@ -64,20 +68,82 @@ st.markdown(
         border-radius: 8px;
     }
     .job-card {
-        border: 2px solid #e0e0e0;
+        border: 2px solid #333;
         border-radius: 10px;
         padding: 1.5rem;
-        margin-bottom: 1.5rem;
-        background-color: #f9f9f9;
+        margin-bottom: 1rem;
+        background-color: rgba(255,255,255,0.05);
     }
+    .job-card h3 { margin: 0; }
+    .job-card-header {
+        display: flex;
+        justify-content: space-between;
+        align-items: start;
+    }
+    .job-card-action { text-align: right; }
+    .job-action { font-weight: bold; }
+    .job-card summary { cursor: pointer; }
     .tier-1 { border-left: 5px solid #28a745; }
     .tier-2 { border-left: 5px solid #17a2b8; }
     .tier-3 { border-left: 5px solid #ffc107; }
     .tier-4 { border-left: 5px solid #6c757d; }
+    .tier-1 .job-action { color: #28a745; }
+    .tier-2 .job-action { color: #17a2b8; }
+    .tier-3 .job-action { color: #ffc107; }
+    .tier-4 .job-action { color: #6c757d; }
 </style>
-""",
-    unsafe_allow_html=True,
+"""
+
+HEADER_HTML = (
+    '<div class="main-header">🎯 AI Job Search Assistant</div>'
+    '<div class="sub-header">Find your perfect job match with AI-powered analysis</div>'
+)
+
+# Step indicator markup for each of the 7 steps (5 form + processing +
+# results); the two final steps show "Step 5 of 5"
+STEP_INDICATOR_HTML = {
+    step: f'<div class="step-indicator">Step {min(step, 5)} of 5</div>'
+    for step in range(1, 8)
+}
+
+
+# Radio options, with label -> position lookups for restoring saved answers
+EXPERIENCE_OPTIONS = (
+    "Recent Graduate (0-1 years)",
+    "Entry Level (1-2 years)",
+    "Mid Level (2-5 years)",
+    "Senior (5-10 years)",
+    "Lead/Principal (10+ years)",
 )
+WORK_OPTIONS = ("Remote", "Hybrid", "On-Site")
+LOCATION_OPTIONS = ("Only my country", "Open to relocation")
+
+EXPERIENCE_INDEX = {option: i for i, option in enumerate(EXPERIENCE_OPTIONS)}
+WORK_INDEX = {option: i for i, option in enumerate(WORK_OPTIONS)}
+LOCATION_INDEX = {option: i for i, option in enumerate(LOCATION_OPTIONS)}
+
+# Status label shown once each pipeline stage (see JobSearchCrew.run_pipeline)
+# has finished, i.e. the label for the stage that runs next
+PIPELINE_LABELS = {
+    "start": "Step 1/5: Analyzing resume...",
+    "resume_analyzed": "Step 2/5: Searching for '{target_role}' jobs...",
+    "jobs_found": "Step 3/5: Matching candidate to jobs...",
+    "jobs_matched": "Step 4/5: Ranking opportunities...",
+    "jobs_ranked": "Step 5/5: Generating final report...",
+    "report_ready": "✅ Analysis complete!",
+}
+
+
+# Page configuration
+st.set_page_config(
+    page_title="AI Job Search Assistant",
+    page_icon="🎯",
+    layout="wide",
+    initial_sidebar_state="collapsed",
+)
+
+# Custom CSS
+st.markdown(CUSTOM_CSS, unsafe_allow_html=True)
 
 
 # Initialize session state
@@ -87,6 +153,16 @@ if "form_data" not in st.session_state:
     st.session_state.form_data = {}
 if "results" not in st.session_state:
     st.session_state.results = None
+if "resume_digest" not in st.session_state:
+    st.session_state.resume_digest = None
+if "resume_filename" not in st.session_state:
+    st.session_state.resume_filename = None
+if "report_cache" not in st.session_state:
+    # Finished pipeline reports keyed on (resume digest, target role)
+    st.session_state.report_cache = {}
+if "pipeline" not in st.session_state:
+    # (report key, JobSearchCrew) of a pipeline run that failed part-way
+    st.session_state.pipeline = None
 
 
 def next_step():
@@ -100,118 +176,256 @@ def prev_step():
         st.session_state.step -= 1
 
 
+def _back_button(step: int):
+    """Render the Back button row below a step's form.
+
+    Back stays outside the form: Enter in a form field presses the form's
+    first submit button, which must be Next.
+    """
+    col1, col2, col3 = st.columns([1, 1, 1])
+
+    with col1:
+        if st.button("← Back", key=f"step{step}_back"):
+            prev_step()
+            st.rerun()
+
+
 def reset_form():
     """Reset the entire form"""
     st.session_state.step = 1
     st.session_state.form_data = {}
     st.session_state.results = None
+    st.session_state.resume_digest = None
+    st.session_state.resume_filename = None
+    st.session_state.pipeline = None
+
+
+def _write_saves(saves: queue.Queue, storage: "CandidateStorage"):
+    """Write queued saves until the None sentinel, then close the storage"""
+    while True:
+        item = saves.get()
+        try:
+            if item is None:
+                break
+            candidate, ranked_jobs = item
+            storage.save_all(candidate=candidate, ranked_jobs=ranked_jobs)
+        finally:
+            saves.task_done()
+
+    storage.close()
+    atexit.unregister(storage.close)
+    atexit.unregister(saves.join)
+
+
+class _SaveQueue:
+    """Front end of the CSV writer thread's queue
+
+    The thread only references the inner queue, so when this object is dropped
+    (st.cache_resource cleared) the finalizer stops the thread, and the thread
+    closes its storage after the pending saves.
+    """
 
+    def __init__(self, saves: queue.Queue):
+        self.put = saves.put
+        finalizer = weakref.finalize(self, saves.put, None)
+        # At interpreter exit the atexit hooks below drain and close instead
+        finalizer.atexit = False
 
-# Header
-st.markdown(
-    '<div class="main-header">🎯 AI Job Search Assistant</div>', unsafe_allow_html=True
-)
-st.markdown(
-    '<div class="sub-header">Find your perfect job match with AI-powered analysis</div>',
-    unsafe_allow_html=True,
-)
 
+@st.cache_resource
+def get_storage_queue() -> _SaveQueue:
+    """
+    Queue of (candidate, ranked_jobs) saves, written by one background thread
 
-# Step indicator (7 total steps: 5 form + processing + results)
-total_steps = 7
-display_step = min(
-    st.session_state.step, 5
-)  # Show max "Step 5 of 5" for user-facing steps
-st.markdown(
-    f'<div class="step-indicator">Step {display_step} of 5</div>',
-    unsafe_allow_html=True,
+    Lets Step 6 move on to the results without waiting for the CSV writes.
+    The CSV storage is created here, not shared through another cached
+    resource, so that replacing this resource can close it.
+    """
+    from src.utils.csv_storage import CandidateStorage
+
+    storage = CandidateStorage()
+    saves = queue.Queue()
+
+    threading.Thread(
+        target=_write_saves, args=(saves, storage), name="csv-writer", daemon=True
+    ).start()
+    # Registered after the storage's own close(), so pending saves run first
+    atexit.register(saves.join)
+    return _SaveQueue(saves)
+
+
+@st.cache_data(show_spinner=False)
+def _cached_extract(digest: str, _file_bytes: bytes, filename: str) -> str:
+    """
+    Extract resume text, memoized on the content digest and file name
+
+    The underscore keeps Streamlit from hashing the raw bytes on every call;
+    the digest of those bytes is the cache key instead.
+    """
+    from src.utils.file_parser import extract_resume_text
+
+    return extract_resume_text(BytesIO(_file_bytes), filename, backend="pymupdf")
+
+
+# Opening tag of the job card for each tier class, formatted once
+_CARD_OPEN = {
+    tier_class: f'<div class="job-card {tier_class}">'
+    for tier_class in ("tier-1", "tier-2", "tier-3", "tier-4")
+}
+
+
+# Job card markup; only the per-job fields are substituted
+_JOB_CARD = string.Template(
+    "${card_open}"
+    '<div class="job-card-header">'
+    "<div>"
+    "<h3>#${rank} - ${title}</h3>"
+    "<p><strong>Company:</strong> ${company}</p>"
+    "<p><strong>${tier}</strong> | "
+    "Score: <strong>${score}/100</strong></p>"
+    "</div>"
+    '<div class="job-card-action">'
+    "<p><strong>Action:</strong></p>"
+    '<p class="job-action">${action}</p>'
+    "</div>"
+    "</div>"
+    "<details><summary>📝 View Details - ${title}</summary>"
+    "<p><strong>Why this rank:</strong></p>"
+    "<p>${rationale}</p>"
+    "</details>"
+    "</div>"
 )
 
-# Progress bar
-if st.session_state.step == 7:
-    progress = 1.0
-else:
-    progress = min((st.session_state.step - 1) / 5, 0.95)  # Scale to 5 form steps
 
-st.progress(progress)
+def _html_text(value) -> str:
+    """
+    Escape an (LLM-provided) value for the card HTML, newlines as <br>
 
-st.markdown("---")
+    The whole report is one markdown HTML block, and a blank line would end
+    it, so no raw newline may reach the markup.
+    """
+    text = html.escape(str(value)).replace("\r\n", "\n").replace("\r", "\n")
+    return text.replace("\n", "<br>")
+
+
+def _render_job(job: dict) -> str:
+    """Job card HTML, with the ranking rationale in a collapsible <details>"""
+    return _JOB_CARD.substitute(
+        card_open=_CARD_OPEN.get(job.get("tier_class"), _CARD_OPEN["tier-2"]),
+        rank=_html_text(job["rank"]),
+        title=_html_text(job["job_title"]),
+        company=_html_text(job["company"]),
+        tier=_html_text(job["tier"]),
+        score=_html_text(job["final_score"]),
+        action=_html_text(job["action_recommendation"]),
+        rationale=_html_text(job["ranking_rationale"]),
+    )
+
+
+def _render_ranked_jobs(ranked_jobs: list) -> str:
+    """
+    All job cards as a single HTML string (one markdown element per report)
+
+    Not wrapped in st.cache_data: hashing the job dicts and unpickling the
+    result on a cache hit costs more than rendering a handful of cards.
+    """
+    return "".join(_render_job(job) for job in ranked_jobs)
+
+
+def _job_list_markdown(jobs: list) -> str:
+    """Bullet list of discovered jobs, shown while they are being matched"""
+    lines = [f"**Found {len(jobs)} jobs:**"]
+    lines.extend(f"- {job.title} @ {job.company}" for job in jobs)
+    return "\n".join(lines)
+
+
+# Page header, step indicator and progress bar. Skipped while Step 6 runs the
+# pipeline, so its status container gets the screen to itself.
+if st.session_state.step != 6:
+    # Header
+    st.markdown(HEADER_HTML, unsafe_allow_html=True)
+
+    # Step indicator (7 total steps: 5 form + processing + results)
+    st.markdown(STEP_INDICATOR_HTML[st.session_state.step], unsafe_allow_html=True)
+
+    # Progress bar
+    if st.session_state.step == 7:
+        progress = 1.0
+    else:
+        progress = min((st.session_state.step - 1) / 5, 0.95)  # Scale to 5 form steps
+
+    st.progress(progress)
+
+    st.markdown("---")
 
 
 # ========== STEP 1: Personal Information ==========
-if st.session_state.step == 1:
+@st.fragment
+def step_1():
+    """Personal Information step"""
     st.header("👤 Personal Information")
 
-    full_name = st.text_input(
-        "Full Name *",
-        value=st.session_state.form_data.get("full_name", ""),
-        placeholder="Enter your full name",
-        help="This will be used to personalize your job recommendations",
-    )
+    # Widgets inside a form only rerun the script when it is submitted
+    with st.form("step1_form", border=False):
+        full_name = st.text_input(
+            "Full Name *",
+            value=st.session_state.form_data.get("full_name", ""),
+            placeholder="Enter your full name",
+            help="This will be used to personalize your job recommendations",
+        )
 
-    col1, col2, col3 = st.columns([1, 1, 1])
+        col1, col2, col3 = st.columns([1, 1, 1])
 
-    with col2:
-        if st.button("Next →", key="step1_next"):
-            if full_name.strip():
-                st.session_state.form_data["full_name"] = full_name
-                next_step()
-                st.rerun()
-            else:
-                st.error("⚠️ Please enter your full name")
+        with col2:
+            submitted = st.form_submit_button("Next →")
+
+    if submitted:
+        if full_name.strip():
+            st.session_state.form_data["full_name"] = full_name
+            next_step()
+            st.rerun()
+        else:
+            st.error("⚠️ Please enter your full name")
 
 
 # ========== STEP 2: Experience Level ==========
-elif st.session_state.step == 2:
+@st.fragment
+def step_2():
+    """Experience Level step"""
     st.header("💼 Experience Level")
 
-    experience_level = st.radio(
-        "What's your current experience level? *",
-        options=[
-            "Recent Graduate (0-1 years)",
-            "Entry Level (1-2 years)",
-            "Mid Level (2-5 years)",
-            "Senior (5-10 years)",
-            "Lead/Principal (10+ years)",
-        ],
-        index=0
-        if "experience_level" not in st.session_state.form_data
-        else [
-            "Recent Graduate (0-1 years)",
-            "Entry Level (1-2 years)",
-            "Mid Level (2-5 years)",
-            "Senior (5-10 years)",
-            "Lead/Principal (10+ years)",
-        ].index(st.session_state.form_data.get("experience_level")),
-        help="Select the option that best describes your professional experience",
-    )
+    with st.form("step2_form", border=False):
+        experience_level = st.radio(
+            "What's your current experience level? *",
+            options=EXPERIENCE_OPTIONS,
+            index=EXPERIENCE_INDEX.get(st.session_state.form_data.get("experience_level"), 0),
+            help="Select the option that best describes your professional experience",
+        )
 
-    col1, col2, col3 = st.columns([1, 1, 1])
+        col1, col2, col3 = st.columns([1, 1, 1])
 
-    with col1:
-        if st.button("← Back", key="step2_back"):
-            prev_step()
-            st.rerun()
+        with col3:
+            submitted = st.form_submit_button("Next →")
 
-    with col3:
-        if st.button("Next →", key="step2_next"):
-            st.session_state.form_data["experience_level"] = experience_level
-            next_step()
-            st.rerun()
+    _back_button(2)
+
+    if submitted:
+        st.session_state.form_data["experience_level"] = experience_level
+        next_step()
+        st.rerun()
 
 
 # ========== STEP 3: Work Preferences ==========
-elif st.session_state.step == 3:
+@st.fragment
+def step_3():
+    """Work Preferences step"""
     st.header("🏢 Work Preferences")
 
+    # Kept outside the form: the location fields below depend on it live
     work_preference = st.radio(
         "What's your preferred work arrangement? *",
-        options=["Remote", "Hybrid", "On-Site"],
-        index=0
-        if "work_preference" not in st.session_state.form_data
-        else ["Remote", "Hybrid", "On-Site"].index(
-            st.session_state.form_data.get("work_preference")
-        ),
+        options=WORK_OPTIONS,
+        index=WORK_INDEX.get(st.session_state.form_data.get("work_preference"), 0),
         help="Select your preferred work location type",
     )
 
@@ -219,82 +433,86 @@ elif st.session_state.step == 3:
     location_preference = None
     country = None
 
-    if work_preference == "On-Site":
-        st.markdown("---")
-
-        location_preference = st.radio(
-            "Location Preference *",
-            options=["Only my country", "Open to relocation"],
-            index=0
-            if "location_preference" not in st.session_state.form_data
-            else ["Only my country", "Open to relocation"].index(
-                st.session_state.form_data.get("location_preference", "Only my country")
-            ),
-        )
+    with st.form("step3_form", border=False):
+        if work_preference == "On-Site":
+            st.markdown("---")
 
-        country = st.text_input(
-            "Country *",
-            value=st.session_state.form_data.get("country", ""),
-            placeholder="e.g., United States, India, United Kingdom",
-            help="Enter the country where you want to work",
-        )
+            location_preference = st.radio(
+                "Location Preference *",
+                options=LOCATION_OPTIONS,
+                index=LOCATION_INDEX.get(
+                    st.session_state.form_data.get("location_preference"), 0
+                ),
+            )
 
-    col1, col2, col3 = st.columns([1, 1, 1])
+            country = st.text_input(
+                "Country *",
+                value=st.session_state.form_data.get("country", ""),
+                placeholder="e.g., United States, India, United Kingdom",
+                help="Enter the country where you want to work",
+            )
 
-    with col1:
-        if st.button("← Back", key="step3_back"):
-            prev_step()
-            st.rerun()
+        col1, col2, col3 = st.columns([1, 1, 1])
 
-    with col3:
-        if st.button("Next →", key="step3_next"):
-            # Validation
-            if work_preference == "On-Site" and not country:
-                st.error("⚠️ Please enter your country")
-            else:
-                st.session_state.form_data["work_preference"] = work_preference
-                st.session_state.form_data["location_preference"] = (
-                    location_preference or "N/A"
-                )
-                st.session_state.form_data["country"] = country or "N/A"
-                next_step()
-                st.rerun()
+        with col3:
+            submitted = st.form_submit_button("Next →")
+
+    _back_button(3)
+
+    if submitted:
+        # Validation
+        if work_preference == "On-Site" and not country:
+            st.error("⚠️ Please enter your country")
+        else:
+            st.session_state.form_data.update(
+                {
+                    "work_preference": work_preference,
+                    "location_preference": location_preference or "N/A",
+                    "country": country or "N/A",
+                }
+            )
+            next_step()
+            st.rerun()
 
 
 # ========== STEP 4: Target Role ==========
-elif st.session_state.step == 4:
+@st.fragment
+def step_4():
+    """Target Role step"""
     st.header("🎯 Target Job Role")
 
-    target_role = st.text_input(
-        "What job role are you looking for? *",
-        value=st.session_state.form_data.get("target_role", ""),
-        placeholder="e.g., Python Developer, Data Scientist, Product Manager",
-        help="Be specific about the role you want to apply for",
-    )
+    with st.form("step4_form", border=False):
+        target_role = st.text_input(
+            "What job role are you looking for? *",
+            value=st.session_state.form_data.get("target_role", ""),
+            placeholder="e.g., Python Developer, Data Scientist, Product Manager",
+            help="Be specific about the role you want to apply for",
+        )
 
-    st.info(
-        "💡 **Tip:** Be specific! Instead of 'Developer', try 'Senior Python Developer' or 'Full-Stack JavaScript Developer'"
-    )
+        st.info(
+            "💡 **Tip:** Be specific! Instead of 'Developer', try 'Senior Python Developer' or 'Full-Stack JavaScript Developer'"
+        )
 
-    col1, col2, col3 = st.columns([1, 1, 1])
+        col1, col2, col3 = st.columns([1, 1, 1])
 
-    with col1:
-        if st.button("← Back", key="step4_back"):
-            prev_step()
-            st.rerun()
+        with col3:
+            submitted = st.form_submit_button("Next →")
 
-    with col3:
-        if st.button("Next →", key="step4_next"):
-            if target_role.strip():
-                st.session_state.form_data["target_role"] = target_role
-                next_step()
-                st.rerun()
-            else:
-                st.error("⚠️ Please enter your target job role")
+    _back_button(4)
+
+    if submitted:
+        if target_role.strip():
+            st.session_state.form_data["target_role"] = target_role
+            next_step()
+            st.rerun()
+        else:
+            st.error("⚠️ Please enter your target job role")
 
 
 # ========== STEP 5: Resume Upload ==========
-elif st.session_state.step == 5:
+@st.fragment
+def step_5():
+    """Resume Upload step"""
     st.header("📄 Upload Your Resume")
 
     uploaded_file = st.file_uploader(
@@ -323,99 +541,105 @@ elif st.session_state.step == 5:
             if not uploaded_file:
                 st.error("⚠️ Please upload your resume")
             else:
-                # Store the uploaded file object for later processing
-                st.session_state.form_data["resume_file"] = uploaded_file
-                st.session_state.step = 6
-                st.rerun()
+                file_bytes = uploaded_file.getvalue()
+                digest = hashlib.blake2b(file_bytes, digest_size=16).hexdigest()
+
+                # Same resume as last time (e.g. "Try Again"): reuse its text.
+                # The name is checked too since it selects the parser.
+                if (
+                    st.session_state.form_data.get("resume_text")
+                    and st.session_state.resume_digest == digest
+                    and st.session_state.resume_filename == uploaded_file.name
+                ):
+                    st.session_state.step = 6
+                    st.rerun()
+
+                try:
+                    with st.spinner("Extracting text from resume..."):
+                        resume_text = _cached_extract(
+                            digest, file_bytes, uploaded_file.name
+                        )
+                except ValueError as e:
+                    st.error(f"❌ {e}")
+                else:
+                    st.session_state.form_data["resume_text"] = resume_text
+                    st.session_state.resume_digest = digest
+                    st.session_state.resume_filename = uploaded_file.name
+                    st.session_state.step = 6
+                    st.rerun()
 
 
 # ========== STEP 6: AI Analysis ==========
-elif st.session_state.step == 6:
+@st.fragment
+def step_6():
+    """AI Analysis step"""
+    from src.core.job_search_crew import JobSearchCrew
+
     st.header("🤖 AI Analysis in Progress")
     st.info("Our team of AI agents is analyzing your profile and searching for jobs...")
 
-    # Progress bar for analysis steps
-    progress_bar = st.progress(0)
-    status_text = st.empty()
-
     try:
-        # Get uploaded resume file
-        resume_file = st.session_state.form_data["resume_file"]
-
-        # Read file content
-        if resume_file.name.endswith(".pdf"):
-            from pypdf import PdfReader
-
-            pdf = PdfReader(resume_file)
-            resume_text = ""
-            for page in pdf.pages:
-                resume_text += page.extract_text() + "\n"
-        else:
-            # DOCX
-            import docx
-
-            doc = docx.Document(resume_file)
-            resume_text = "\n".join([para.text for para in doc.paragraphs])
+        # Resume text was extracted in Step 5
+        resume_text = st.session_state.form_data["resume_text"]
 
         # Log to debug
         print(f"📄 Resume text length: {len(resume_text)} chars")
 
-        with st.spinner("Agents are working... please wait"):
-            # Initialize Crew
-            crew = JobSearchCrew()
-
-            # Step 1: Analyze Resume
-            status_text.text("Step 1/5: Analyzing resume...")
-            progress_bar.progress(0.2)
-            candidate_profile = crew.analyze_resume(resume_text)
-
-            # Step 2: Find Jobs
-            status_text.text(
-                f"Step 2/5: Searching for '{st.session_state.form_data['target_role']}' jobs..."
+        target_role = st.session_state.form_data["target_role"]
+
+        # The agents are slow and their inputs are just the resume and the
+        # role, so a repeated search (retry, new search with the same
+        # inputs) reuses the earlier report instead of calling the LLMs again
+        report_key = (st.session_state.resume_digest, target_role)
+        report = st.session_state.report_cache.get(report_key)
+
+        if report is None:
+            # A single status container carries all stage updates
+            with st.status("⚙️ Processing your application", expanded=True) as status:
+                # Resume the crew of a failed run with the same inputs, so "Try
+                # Again" skips the stages it already finished. Otherwise start
+                # a new one (it holds this candidate's pipeline state).
+                if st.session_state.pipeline and st.session_state.pipeline[0] == report_key:
+                    crew = st.session_state.pipeline[1]
+                else:
+                    crew = JobSearchCrew()
+                    st.session_state.pipeline = (report_key, crew)
+
+                status.update(label=PIPELINE_LABELS["start"])
+
+                # The "Step N/5" label doubles as the progress indicator
+                for stage, _progress, payload in crew.run_pipeline(
+                    resume_text, target_role, num_jobs=5, resume=True
+                ):
+                    if stage == "jobs_found":
+                        # Show what was found while matching is still running
+                        st.markdown(_job_list_markdown(payload))
+                    elif stage == "report_ready":
+                        report = payload
+                    status.update(
+                        label=PIPELINE_LABELS[stage].format(target_role=target_role)
+                    )
+
+                status.update(state="complete")
+
+            st.session_state.report_cache[report_key] = report
+            st.session_state.pipeline = None
+
+        # Save to CSV in the background
+        get_storage_queue().put(
+            (
+                {
+                    "full_name": st.session_state.form_data["full_name"],
+                    "experience_level": st.session_state.form_data["experience_level"],
+                    "work_preference": st.session_state.form_data["work_preference"],
+                    "location_preference": st.session_state.form_data["location_preference"],
+                    "country": st.session_state.form_data["country"],
+                    "target_role": st.session_state.form_data["target_role"],
+                    "skills_count": report["candidate"]["skills_count"],
+                    "total_experience_years": report["candidate"]["total_years"],
+                },
+                report["ranked_opportunities"],
             )
-            progress_bar.progress(0.4)
-            found_jobs = crew.find_jobs(
-                target_role=st.session_state.form_data["target_role"], num_jobs=5
-            )
-
-            # Step 3: Match Skills
-            status_text.text(
-                f"Step 3/5: Matching candidate to {len(found_jobs)} jobs..."
-            )
-            progress_bar.progress(0.6)
-            crew.match_all_jobs()
-
-            # Step 4: Rank Jobs
-            status_text.text("Step 4/5: Ranking opportunities...")
-            progress_bar.progress(0.8)
-            ranking = crew.rank_opportunities()
-
-            # Step 5: Report
-            status_text.text("Step 5/5: Generating final report...")
-            progress_bar.progress(0.9)
-            report = crew.generate_report()
-
-        progress_bar.progress(1.0)
-        status_text.success("✅ Analysis complete!")
-
-        # Initialize storage
-        storage = CandidateStorage()
-
-        # Save to CSV
-        storage.save_candidate(
-            full_name=st.session_state.form_data["full_name"],
-            experience_level=st.session_state.form_data["experience_level"],
-            work_preference=st.session_state.form_data["work_preference"],
-            location_preference=st.session_state.form_data["location_preference"],
-            country=st.session_state.form_data["country"],
-            target_role=st.session_state.form_data["target_role"],
-            skills_count=report["candidate"]["skills_count"],
-            total_experience_years=report["candidate"]["total_years"],
-        )
-
-        storage.save_job_results(
-            candidate_name=st.session_state.form_data["full_name"],
-            ranked_jobs=ranking["ranked_jobs"],
         )
 
         # Store results
@@ -435,7 +659,9 @@ elif st.session_state.step == 6:
 
 
 # ========== STEP 7: Results ==========
-elif st.session_state.step == 7:
+@st.fragment
+def step_7():
+    """Results step"""
     st.header("🎉 Your Personalized Job Recommendations")
 
     report = st.session_state.results
@@ -480,43 +706,9 @@ elif st.session_state.step == 7:
     # Ranked Jobs
     st.markdown("### 📋 Ranked Job Opportunities")
 
-    for job in report["ranked_opportunities"]:
-        tier = job["tier"].split()[1] if " " in job["tier"] else "2"
-
-        # Use colored border based on tier
-        border_colors = {"1": "#28a745", "2": "#17a2b8", "3": "#ffc107", "4": "#6c757d"}
-        border_color = border_colors.get(tier, "#17a2b8")
-
-        # Create job card with inline styling
-        st.markdown(
-            f"""
-            <div style="
-                border: 2px solid #333;
-                border-left: 5px solid {border_color};
-                border-radius: 10px;
-                padding: 1.5rem;
-                margin-bottom: 1rem;
-                background-color: rgba(255,255,255,0.05);
-            ">
-                <div style="display: flex; justify-content: space-between; align-items: start;">
-                    <div>
-                        <h3 style="margin: 0;">#{job['rank']} - {job['job_title']}</h3>
-                        <p><strong>Company:</strong> {job['company']}</p>
-                        <p><strong>{job['tier']}</strong> | Score: <strong>{job['final_score']}/100</strong></p>
-                    </div>
-                    <div style="text-align: right;">
-                        <p><strong>Action:</strong></p>
-                        <p style="color: {border_color}; font-weight: bold;">{job['action_recommendation']}</p>
-                    </div>
-                </div>
-            </div>
-            """,
-            unsafe_allow_html=True,
-        )
-
-        with st.expander(f"📝 View Details - {job['job_title']}"):
-            st.markdown(f"**Why this rank:**")
-            st.write(job["ranking_rationale"])
+    st.markdown(
+        _render_ranked_jobs(report["ranked_opportunities"]), unsafe_allow_html=True
+    )
 
     st.markdown("---")
 
@@ -533,6 +725,20 @@ elif st.session_state.step == 7:
             pass
 
 
+# Render only the active step. Each step is a fragment, so widget
+# interactions inside a step rerun just that step, not the whole script.
+STEPS = {
+    1: step_1,
+    2: step_2,
+    3: step_3,
+    4: step_4,
+    5: step_5,
+    6: step_6,
+    7: step_7,
+}
+STEPS[st.session_state.step]()
+
+
 # Footer
 st.markdown("---")
 st.markdown(
@@ -13,7 +13,7 @@ Key Responsibilities:
 """
 
 from crewai import Agent, Task, Crew, LLM
-from typing import List
+from typing import List, Optional
 import json
 
 from ..config.settings import settings
@@ -162,7 +162,8 @@ def create_job_discovery_task(
 def discover_jobs(
     candidate: CandidateProfile,
     target_role: str,
-    num_jobs: int = 5
+    num_jobs: int = 5,
+    search_results: Optional[List[JobPosting]] = None
 ) -> List[JobPosting]:
     """
     Main function: Discover relevant jobs for a candidate.
@@ -176,6 +177,9 @@ def discover_jobs(
         candidate: The candidate's profile
         target_role: Job title/role to search for
         num_jobs: Number of jobs to return
+        search_results: Optional pre-fetched results of
+            search_jobs_for_candidate(target_role, [], num_results=10).
+            Lets callers run the API search concurrently with other work.
     
     Returns:
         List of JobPosting objects
@@ -183,6 +187,12 @@ def discover_jobs(
     Raises:
         ValueError: If job discovery fails
     """
+    def _search(num_results: int) -> List[JobPosting]:
+        """Use the pre-fetched results when we have them, otherwise search"""
+        if search_results is not None:
+            return search_results[:num_results]
+        return search_jobs_for_candidate(target_role, [], num_results=num_results)
+    
     # Create LLM and agent
     llm = create_ollama_llm()
     agent = create_job_discovery_agent(llm)
@@ -218,12 +228,12 @@ def discover_jobs(
         if not recommended:
             print("⚠️  Agent didn't find any suitable jobs")
             # Fallback: search directly
-            return search_jobs_for_candidate(target_role, [], num_results=num_jobs)
+            return _search(num_jobs)
         
         # Fetch full job details for recommended jobs
         # Since we already have the job data from the tool, we'll search again
         # In production, you'd cache the results
-        all_jobs = search_jobs_for_candidate(target_role, [], num_results=10)
+        all_jobs = _search(10)
         
         # Filter to only recommended jobs
         recommended_job_ids = [job["job_id"] for job in recommended]
@@ -241,5 +251,5 @@ def discover_jobs(
     except Exception as e:
         print(f"⚠️  Error parsing agent output: {e}")
         # Fallback: direct search
-        return search_jobs_for_candidate(target_role, [], num_results=num_jobs)
+        return _search(num_jobs)
 
@@ -15,12 +15,27 @@ This is Option B (Intelligent Ranker) - more impressive for resume purposes.
 
 from crewai import Agent, Task, Crew, LLM
 from typing import List, Dict, Any
+from operator import attrgetter
 import json
 import re
 
 from ..config.settings import settings
 from ..models.domain import JobMatchResult
 
+# Keys every ranking must have (read by the crew's report)
+RANKING_KEYS = ("ranked_jobs", "top_recommendation", "overall_strategy")
+
+# Keys every ranked job must have (read by the results page)
+RANKED_JOB_KEYS = (
+    "rank",
+    "job_title",
+    "company",
+    "tier",
+    "final_score",
+    "action_recommendation",
+    "ranking_rationale",
+)
+
 
 def create_ollama_llm() -> LLM:
     """Initialize Ollama LLM with proper formatting"""
@@ -244,6 +259,8 @@ def rank_job_matches(match_results: List[JobMatchResult]) -> Dict[str, Any]:
         if json_match:
             json_str = json_match.group()
             parsed_data = json.loads(json_str)
+            # The JSON is used as-is downstream, so it must be complete
+            validate_ranking(parsed_data)
             return parsed_data
         else:
             raise ValueError("No JSON found in agent output")
@@ -254,6 +271,32 @@ def rank_job_matches(match_results: List[JobMatchResult]) -> Dict[str, Any]:
         return _fallback_ranking(match_results)
 
 
+def validate_ranking(ranking: Any) -> None:
+    """
+    Check that a ranking has every key the report and results page read.
+    
+    Raises:
+        ValueError: If a ranking or ranked-job key is missing
+    """
+    if not isinstance(ranking, dict):
+        raise ValueError("Ranking output is not a JSON object")
+    
+    missing = [key for key in RANKING_KEYS if key not in ranking]
+    if missing:
+        raise ValueError(f"Ranking output is missing {', '.join(missing)}")
+    
+    ranked_jobs = ranking["ranked_jobs"]
+    if not isinstance(ranked_jobs, list) or not ranked_jobs:
+        raise ValueError("Ranking output has no ranked jobs")
+    
+    for i, job in enumerate(ranked_jobs, 1):
+        if not isinstance(job, dict):
+            raise ValueError(f"Ranked job {i} is not a JSON object")
+        missing = [key for key in RANKED_JOB_KEYS if key not in job]
+        if missing:
+            raise ValueError(f"Ranked job {i} is missing {', '.join(missing)}")
+
+
 def _fallback_ranking(match_results: List[JobMatchResult]) -> Dict[str, Any]:
     """
     Fallback ranking if agent fails - simple score-based sort.
@@ -263,7 +306,7 @@ def _fallback_ranking(match_results: List[JobMatchResult]) -> Dict[str, Any]:
     # Sort by overall_fit_score
     sorted_results = sorted(
         match_results,
-        key=lambda x: x.overall_fit_score,
+        key=attrgetter("overall_fit_score"),
         reverse=True
     )
     
@@ -15,7 +15,13 @@ from typing import Dict, Any
 import json
 
 from ..config.settings import settings
-from ..models.domain import CandidateProfile, Skill, SkillCategory, ExperienceLevel
+from ..models.domain import (
+    CandidateProfile,
+    Skill,
+    SkillCategory,
+    ExperienceLevel,
+    normalize_skill_category,
+)
 
 
 def create_ollama_llm() -> LLM:
@@ -250,6 +256,10 @@ def parse_resume(resume_text: str) -> CandidateProfile:
         # Manually inject the raw resume text (we didn't ask LLM to output it to avoid JSON errors)
         parsed_data['raw_resume_text'] = resume_text
         
+        # Map free-form LLM categories to SkillCategory values up front,
+        # so Pydantic only has to do a plain enum lookup per skill
+        normalize_skill_categories(parsed_data)
+        
         candidate_profile = CandidateProfile(**parsed_data)
         
         return candidate_profile
@@ -260,6 +270,20 @@ def parse_resume(resume_text: str) -> CandidateProfile:
         raise ValueError(f"Failed to create CandidateProfile from agent output: {e}")
 
 
+def normalize_skill_categories(parsed_data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Normalize every skill category in the parsed agent output in place.
+    
+    LLMs often invent categories ("AI/ML", "Frameworks-Libraries", ...).
+    These are mapped onto SkillCategory values once, before the data
+    reaches the CandidateProfile model.
+    """
+    for skill in parsed_data.get('skills') or []:
+        if isinstance(skill, dict) and isinstance(skill.get('category'), str):
+            skill['category'] = normalize_skill_category(skill['category'])
+    return parsed_data
+
+
 def repair_json(json_str: str) -> str:
     """
     Attempt to repair common JSON errors from LLM output.
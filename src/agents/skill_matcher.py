@@ -124,7 +124,7 @@ def create_skill_matching_task(
     # Format candidate skills for the prompt
     candidate_skills_str = "\n".join(
         [
-            f"  - {skill.name} ({skill.category}): "
+            f"  - {skill.name} ({skill.category.value}): "
             f"{skill.years_experience or 'unspecified'} years, "
             f"{skill.proficiency or 'unspecified'} proficiency"
             for skill in candidate.skills
@@ -390,7 +390,7 @@ def create_batch_skill_matching_task(
     # Format candidate skills for the prompt
     candidate_skills_str = "\n".join(
         [
-            f"  - {skill.name} ({skill.category}): "
+            f"  - {skill.name} ({skill.category.value}): "
             f"{skill.years_experience or 'unspecified'} years, "
             f"{skill.proficiency or 'unspecified'} proficiency"
             for skill in candidate.skills
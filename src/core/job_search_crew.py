@@ -10,8 +10,10 @@ This demonstrates the full power of CrewAI's multi-agent architecture.
 Each agent focuses on its specialty, and this crew coordinates them all.
 """
 
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, Iterator, List, Optional, Tuple
 from datetime import datetime
+import re
+from concurrent.futures import Future, ThreadPoolExecutor
 
 from ..models.domain import (
     CandidateProfile,
@@ -23,6 +25,25 @@ from ..agents.resume_analyst import parse_resume
 from ..agents.job_discovery import discover_jobs
 from ..agents.skill_matcher import match_candidate_to_job, match_candidate_to_jobs_batch
 from ..agents.ranking_agent import rank_job_matches
+from ..tools.job_search_tools import search_jobs_for_candidate
+
+# CSS class for each ranking tier number, resolved once per job at ranking time
+_TIER_CLASS = {
+    "1": "tier-1",
+    "2": "tier-2",
+    "3": "tier-3",
+    "4": "tier-4",
+}
+
+# The tier number in labels like 'TIER 1', 'TIER 1 "Top Priority"' or
+# 'Tier 3 - Worth Considering'
+_TIER_NUMBER = re.compile(r"TIER\s*(\d)", re.IGNORECASE)
+
+
+def _tier_class(tier: Any) -> str:
+    """CSS class for a ranking tier label (tier-2 if it has no known tier number)"""
+    match = _TIER_NUMBER.search(str(tier))
+    return _TIER_CLASS.get(match.group(1), "tier-2") if match else "tier-2"
 
 
 class JobSearchCrew:
@@ -45,6 +66,20 @@ class JobSearchCrew:
         self.job_matches: List[JobMatchResult] = []
         self.ranking: Optional[Dict[str, Any]] = None
         self.execution_log: List[str] = []
+        # (resume_text, target_role, num_jobs) the stored stage results were
+        # computed for, see run_pipeline()
+        self._pipeline_inputs: Optional[Tuple[str, str, int]] = None
+        # Background job board search started by run_pipeline(), kept so a
+        # resumed run reuses it instead of calling the API again
+        self._prefetched_jobs: Optional[Future] = None
+
+    def _reset_stages(self):
+        """Drop all stage results so the next pipeline run starts from scratch"""
+        self.candidate_profile = None
+        self.discovered_jobs = []
+        self.job_matches = []
+        self.ranking = None
+        self._prefetched_jobs = None
 
     def log(self, message: str):
         """Log execution steps for debugging and transparency"""
@@ -66,7 +101,10 @@ class JobSearchCrew:
         self.log("Step 1/5: Analyzing resume...")
 
         try:
-            self.candidate_profile = parse_resume(resume_text)
+            # Only stored once parsed and validated, so run_pipeline() can
+            # treat a stored profile as a finished stage
+            candidate_profile = parse_resume(resume_text)
+            self.candidate_profile = candidate_profile
             self.log(f"✅ Resume analyzed: {self.candidate_profile.name}")
             self.log(f"   Skills: {len(self.candidate_profile.skills)}")
             self.log(
@@ -77,13 +115,20 @@ class JobSearchCrew:
             self.log(f"❌ Resume analysis failed: {e}")
             raise
 
-    def find_jobs(self, target_role: str, num_jobs: int = 5) -> List[JobPosting]:
+    def find_jobs(
+        self,
+        target_role: str,
+        num_jobs: int = 5,
+        search_results: Optional[List[JobPosting]] = None,
+    ) -> List[JobPosting]:
         """
         Step 2: Discover relevant job opportunities
 
         Args:
             target_role: The job title/role to search for
             num_jobs: Number of jobs to find
+            search_results: Optional pre-fetched API search results
+                (see discover_jobs)
 
         Returns:
             List of JobPosting objects
@@ -98,6 +143,7 @@ class JobSearchCrew:
                 candidate=self.candidate_profile,
                 target_role=target_role,
                 num_jobs=num_jobs,
+                search_results=search_results,
             )
             self.log(f"✅ Found {len(self.discovered_jobs)} job opportunities")
             return self.discovered_jobs
@@ -123,44 +169,65 @@ class JobSearchCrew:
 
         try:
             # Use batch processing for efficiency (1 LLM call instead of N calls)
-            self.job_matches = match_candidate_to_jobs_batch(
+            job_matches = match_candidate_to_jobs_batch(
                 candidate=self.candidate_profile, jobs=self.discovered_jobs
             )
 
             # Log results for each job
-            for i, match in enumerate(self.job_matches, 1):
+            for i, match in enumerate(job_matches, 1):
                 self.log(
                     f"   Job {i}/{len(self.discovered_jobs)}: {match.job_posting.title} - Score: {match.overall_fit_score}/100"
                 )
 
+            self.job_matches = job_matches
+
             self.log(f"✅ Completed {len(self.job_matches)} job matches in batch")
             return self.job_matches
 
         except Exception as e:
             self.log(f"❌ Batch matching failed: {e}")
-            self.log("   Falling back to sequential processing...")
+            self.log("   Falling back to per-job processing...")
+
+            # Fallback: one LLM call per job, run concurrently since the
+            # matches are independent of each other. Results are collected
+            # locally and stored only once the whole fallback has finished.
+            job_matches = []
+            with ThreadPoolExecutor(max_workers=len(self.discovered_jobs)) as executor:
+                futures = [
+                    executor.submit(self.match_job, job) for job in self.discovered_jobs
+                ]
+
+                for i, (job, future) in enumerate(zip(self.discovered_jobs, futures), 1):
+                    try:
+                        match_result = future.result()
+                        job_matches.append(match_result)
+                        self.log(
+                            f"   ✅ Job {i}/{len(self.discovered_jobs)}: {job.title} - Score: {match_result.overall_fit_score}/100"
+                        )
+                    except Exception as e:
+                        self.log(f"   ⚠️  Failed to match job {i}: {e}")
+                        continue
+
+            self.job_matches = job_matches
+            self.log(f"✅ Completed {len(self.job_matches)} job matches (parallel)")
+            return self.job_matches
 
-            # Fallback to sequential processing if batch fails
-            self.job_matches = []
-            for i, job in enumerate(self.discovered_jobs, 1):
-                try:
-                    self.log(
-                        f"   Matching job {i}/{len(self.discovered_jobs)}: {job.title}"
-                    )
+    def match_job(self, job: JobPosting) -> JobMatchResult:
+        """
+        Match the analyzed candidate against a single job.
 
-                    match_result = match_candidate_to_job(
-                        candidate=self.candidate_profile, job=job
-                    )
+        Does not modify crew state, so it is safe to call from worker threads.
 
-                    self.job_matches.append(match_result)
-                    self.log(f"   ✅ Score: {match_result.overall_fit_score}/100")
+        Args:
+            job: The job posting to evaluate
 
-                except Exception as e:
-                    self.log(f"   ⚠️  Failed to match job {i}: {e}")
-                    continue
+        Returns:
+            JobMatchResult for this job
+        """
+        if not self.candidate_profile:
+            raise ValueError("Must analyze resume first")
 
-            self.log(f"✅ Completed {len(self.job_matches)} job matches (sequential)")
-            return self.job_matches
+        return match_candidate_to_job(candidate=self.candidate_profile, job=job)
 
     def rank_opportunities(self) -> Dict[str, Any]:
         """
@@ -175,10 +242,20 @@ class JobSearchCrew:
         self.log(f"Step 4/5: Ranking {len(self.job_matches)} opportunities...")
 
         try:
-            self.ranking = rank_job_matches(self.job_matches)
+            # rank_job_matches() falls back to a score-based ranking when the
+            # LLM's output is incomplete, so the result is always complete
+            ranking = rank_job_matches(self.job_matches)
+
+            # Precompute the UI tier class so the frontend doesn't parse tiers
+            for job in ranking["ranked_jobs"]:
+                job["tier_class"] = _tier_class(job.get("tier", ""))
+
+            # Only a valid ranking is kept, so a retry re-runs a failed one
+            self.ranking = ranking
             self.log(f"✅ Jobs ranked and prioritized")
             return self.ranking
         except Exception as e:
+            self.ranking = None
             self.log(f"❌ Ranking failed: {e}")
             raise
 
@@ -223,6 +300,79 @@ class JobSearchCrew:
         self.log("✅ Report generated successfully")
         return report
 
+    def run_pipeline(
+        self,
+        resume_text: str,
+        target_role: str,
+        num_jobs: int = 5,
+        resume: bool = False,
+    ) -> Iterator[Tuple[str, float, Any]]:
+        """
+        Execute the pipeline step by step, yielding after each stage.
+
+        Lets the UI show partial results (e.g. the discovered jobs) while
+        the remaining stages are still running.
+
+        Args:
+            resume_text: Raw resume text
+            target_role: Job title to search for
+            num_jobs: Number of jobs to analyze
+            resume: Continue a previous run of this crew instead of starting
+                over (see below)
+
+        Yields:
+            (stage, progress, payload) tuples, in order:
+            - ("resume_analyzed", 0.2, CandidateProfile)
+            - ("jobs_found", 0.4, List[JobPosting])
+            - ("jobs_matched", 0.6, List[JobMatchResult])
+            - ("jobs_ranked", 0.8, ranking dict)
+            - ("report_ready", 1.0, report dict)
+
+        With resume=True, stages this crew already completed for the same
+        inputs are not run again (their stored result is yielded instead),
+        so calling this again after a failure picks up at the stage that
+        failed. Otherwise, or if the inputs changed, every stage runs.
+        """
+        inputs = (resume_text, target_role, num_jobs)
+        if not resume or inputs != self._pipeline_inputs:
+            self._reset_stages()
+        self._pipeline_inputs = inputs
+
+        if not self.discovered_jobs and self._prefetched_jobs is None:
+            # The job board search doesn't need the candidate profile, so
+            # fetch it in the background while the resume is analyzed.
+            # shutdown(wait=False) lets the submitted search finish on its
+            # own, so a failing stage below doesn't wait for the request.
+            executor = ThreadPoolExecutor(max_workers=1)
+            self._prefetched_jobs = executor.submit(
+                search_jobs_for_candidate, target_role, [], num_results=10
+            )
+            executor.shutdown(wait=False)
+
+        if self.candidate_profile is None:
+            self.analyze_resume(resume_text)
+        yield "resume_analyzed", 0.2, self.candidate_profile
+
+        if not self.discovered_jobs:
+            try:
+                search_results = self._prefetched_jobs.result()
+            except Exception:
+                # Don't keep a failed search around - a retry searches again
+                self._prefetched_jobs = None
+                raise
+            self.find_jobs(target_role, num_jobs, search_results=search_results)
+        yield "jobs_found", 0.4, self.discovered_jobs
+
+        if not self.job_matches:
+            self.match_all_jobs()
+        yield "jobs_matched", 0.6, self.job_matches
+
+        if self.ranking is None:
+            self.rank_opportunities()
+        yield "jobs_ranked", 0.8, self.ranking
+
+        yield "report_ready", 1.0, self.generate_report()
+
     def run_full_pipeline(
         self, resume_text: str, target_role: str, num_jobs: int = 5
     ) -> Dict[str, Any]:
@@ -251,12 +401,11 @@ class JobSearchCrew:
         self.log("=" * 60)
 
         try:
-            # Execute pipeline
-            self.analyze_resume(resume_text)
-            self.find_jobs(target_role, num_jobs)
-            self.match_all_jobs()
-            self.rank_opportunities()
-            report = self.generate_report()
+            # Execute pipeline; the last stage yields the report
+            for _stage, _progress, report in self.run_pipeline(
+                resume_text, target_role, num_jobs
+            ):
+                pass
 
             self.log("=" * 60)
             self.log("🎉 Pipeline completed successfully!")
@@ -6,7 +6,8 @@ from .domain import (
     CandidateProfile,
     JobPosting,
     SkillMatch,
-    JobMatchResult
+    JobMatchResult,
+    normalize_skill_category,
 )
 
 __all__ = [
@@ -16,5 +17,6 @@ __all__ = [
     "CandidateProfile",
     "JobPosting",
     "SkillMatch",
-    "JobMatchResult"
+    "JobMatchResult",
+    "normalize_skill_category",
 ]
@@ -6,6 +6,7 @@ Following Domain-Driven Design (DDD) principles:
 - Models are independent of infrastructure (databases, APIs)
 - Models enforce business rules through validation
 - Models are immutable where possible (Pydantic frozen)
+- Core schemas are built on first use (defer_build) to keep imports fast
 
 Why this matters for resume-quality:
 - Shows understanding of clean architecture
@@ -14,9 +15,14 @@ Why this matters for resume-quality:
 """
 
 from typing import List, Optional, Dict, Any
-from datetime import datetime
+from datetime import datetime, timezone
 from enum import Enum
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+
+
+def _utc_now() -> datetime:
+    """Timezone-aware UTC timestamp (datetime.utcnow() is deprecated)"""
+    return datetime.now(timezone.utc)
 
 
 class ExperienceLevel(str, Enum):
@@ -48,14 +54,69 @@ class SkillCategory(str, Enum):
     OTHER = "other"
 
 
+# Map common LLM category variations to valid SkillCategory values.
+# Keys are already normalized (lowercase, underscores).
+_CATEGORY_MAPPING = {
+    # AI/ML related -> domain_knowledge
+    "ai_machine_learning": "domain_knowledge",
+    "machine_learning": "domain_knowledge",
+    "artificial_intelligence": "domain_knowledge",
+    "ai": "domain_knowledge",
+    "ml": "domain_knowledge",
+    "data_science": "domain_knowledge",
+    "data_analytics": "domain_knowledge",
+    "nlp": "domain_knowledge",
+    "computer_vision": "domain_knowledge",
+    # Framework/Library variations
+    "framework_library": "library",
+    "frameworks_libraries": "library",
+    # Web related
+    "web_development": "framework",
+    "frontend": "framework",
+    "backend": "framework",
+    "web_framework": "framework",
+    # Tool/Platform variations
+    "tool_platform": "tool",
+    "tools_platforms": "tool",
+    # Other common ones
+    "language": "programming_language",
+    "programming": "programming_language",
+    "api": "tool",
+    "testing": "methodology",
+    "agile": "methodology",
+    "scrum": "methodology",
+    "version_control": "tool",
+    "containerization": "devops",
+    "orchestration": "devops",
+    "ci_cd": "devops",
+    "infrastructure": "cloud",
+}
+
+# Built once at import time: valid values map to themselves, variations to their target
+_CATEGORY_LOOKUP = {
+    **{cat.value: cat.value for cat in SkillCategory},
+    **_CATEGORY_MAPPING,
+}
+_CATEGORY_TRANS = str.maketrans("/-", "__")
+
+
+def normalize_skill_category(value: str) -> str:
+    """Map any category string to a valid SkillCategory value ('other' if unknown)"""
+    # Normalize (lowercase, strip, '/' and '-' -> '_') and resolve in one lookup
+    return _CATEGORY_LOOKUP.get(value.lower().strip().translate(_CATEGORY_TRANS), "other")
+
+
 class Skill(BaseModel):
     """
     Represents a single skill with proficiency level
     
     Example: Skill(name="Python", category="programming_language", years=3)
+    
+    The category must already be a valid SkillCategory value; free-form
+    LLM categories are mapped with normalize_skill_category() beforehand.
     """
     name: str = Field(description="Skill name (e.g., 'Python', 'Leadership')")
-    category: str = Field(description="Type of skill")
+    category: SkillCategory = Field(description="Type of skill")
     years_experience: Optional[float] = Field(
         default=None,
         ge=0,
@@ -66,71 +127,8 @@ class Skill(BaseModel):
         description="Self-assessed level: beginner, intermediate, advanced, expert"
     )
     
-    @field_validator('category')
-    @classmethod
-    def normalize_category(cls, v: str) -> str:
-        """Map any unknown category to a valid SkillCategory value"""
-        # Get all valid category values
-        valid_categories = {cat.value for cat in SkillCategory}
-        
-        # If already valid, return as-is
-        if v in valid_categories:
-            return v
-        
-        # Normalize: replace slashes with underscores, lowercase, strip
-        normalized = v.lower().strip().replace("/", "_").replace("-", "_")
-        
-        # If normalized version is valid, return it
-        if normalized in valid_categories:
-            return normalized
-        
-        # Map common variations to valid categories
-        category_mapping = {
-            # AI/ML related -> domain_knowledge
-            "ai_machine_learning": "domain_knowledge",
-            "machine_learning": "domain_knowledge",
-            "artificial_intelligence": "domain_knowledge",
-            "ai": "domain_knowledge",
-            "ml": "domain_knowledge",
-            "data_science": "domain_knowledge",
-            "data_analytics": "domain_knowledge",
-            "nlp": "domain_knowledge",
-            "computer_vision": "domain_knowledge",
-            # Framework/Library variations
-            "framework_library": "library",
-            "frameworks_libraries": "library",
-            # Web related
-            "web_development": "framework",
-            "frontend": "framework",
-            "backend": "framework",
-            "web_framework": "framework",
-            # Tool/Platform variations
-            "tool_platform": "tool",
-            "tools_platforms": "tool",
-            # Other common ones
-            "language": "programming_language",
-            "programming": "programming_language",
-            "api": "tool",
-            "testing": "methodology",
-            "agile": "methodology",
-            "scrum": "methodology",
-            "version_control": "tool",
-            "containerization": "devops",
-            "orchestration": "devops",
-            "ci_cd": "devops",
-            "infrastructure": "cloud",
-        }
-        
-        # Check if we have a mapping
-        if normalized in category_mapping:
-            return category_mapping[normalized]
-        
-        # Default to "other" for any unknown category
-        return "other"
-    
-    class Config:
-        # Makes model immutable - professional practice for value objects
-        frozen = True
+    # Makes model immutable - professional practice for value objects
+    model_config = ConfigDict(frozen=True, defer_build=True)
 
 
 class CandidateProfile(BaseModel):
@@ -140,6 +138,8 @@ class CandidateProfile(BaseModel):
     This is what the Resume Analysis Agent produces.
     It's the "canonical" representation of the candidate.
     """
+    model_config = ConfigDict(defer_build=True)
+
     # Basic information
     name: Optional[str] = Field(default=None, description="Candidate name")
     email: Optional[str] = Field(default=None, description="Contact email")
@@ -181,7 +181,7 @@ class CandidateProfile(BaseModel):
     # Metadata
     raw_resume_text: str = Field(default="", description="Original resume text")
     analyzed_at: datetime = Field(
-        default_factory=datetime.utcnow,
+        default_factory=_utc_now,
         description="When this profile was created"
     )
     
@@ -264,6 +264,8 @@ class JobPosting(BaseModel):
     
     This is what the Job Discovery Agent finds/creates.
     """
+    model_config = ConfigDict(defer_build=True)
+
     # Job identifiers
     job_id: str = Field(description="Unique job identifier")
     title: str = Field(description="Job title")
@@ -305,6 +307,8 @@ class SkillMatch(BaseModel):
     
     This is what the Skill Matching Agent produces.
     """
+    model_config = ConfigDict(defer_build=True)
+
     skill_name: str = Field(description="Name of the skill being matched")
     candidate_has: bool = Field(description="Does candidate have this skill?")
     candidate_years: Optional[float] = Field(
@@ -332,6 +336,8 @@ class JobMatchResult(BaseModel):
     
     This is the final output combining all agent analyses.
     """
+    model_config = ConfigDict(defer_build=True)
+
     # References
     candidate_profile: CandidateProfile
     job_posting: JobPosting
@@ -376,6 +382,6 @@ class JobMatchResult(BaseModel):
     
     # Metadata
     evaluated_at: datetime = Field(
-        default_factory=datetime.utcnow,
+        default_factory=_utc_now,
         description="When this evaluation was performed"
     )
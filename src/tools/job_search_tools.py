@@ -11,15 +11,46 @@ Why a Custom Tool?
 - Tools can be reused across multiple agents
 """
 
+import functools
 import requests
+import sys
 from typing import List, Dict, Any, Optional, Type
 from crewai.tools import BaseTool
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter, ValidationError
 
 from ..config.settings import settings
 from ..models.domain import JobPosting, ExperienceLevel
 
 
+@functools.cache
+def _job_postings_adapter() -> TypeAdapter:
+    """Validator for a whole list of JobPosting payloads (built on first use)."""
+    return TypeAdapter(List[JobPosting])
+
+
+# Common tech skills to look for (can be expanded), paired with display names.
+# The display names are interned so every extracted skill shares one string.
+_SKILL_KEYWORDS = tuple(
+    (keyword, sys.intern(keyword.title())) for keyword in (
+        "python", "java", "javascript", "typescript", "react", "angular", "vue",
+        "node.js", "django", "flask", "fastapi", "spring", "kubernetes", "docker",
+        "aws", "azure", "gcp", "sql", "postgresql", "mongodb", "redis",
+        "machine learning", "deep learning", "tensorflow", "pytorch",
+        "git", "ci/cd", "agile", "scrum", "rest api", "graphql"
+    )
+)
+
+
+def _intern(value: Any) -> Any:
+    """
+    Intern strings that repeat across postings (company, location, ...).
+    
+    Large result sets then hold one copy of each value, and equality/hash
+    checks on them are cheaper. Non-string values are returned unchanged.
+    """
+    return sys.intern(value) if isinstance(value, str) else value
+
+
 class JobSearchToolSchema(BaseModel):
     """Schema for job search tool arguments."""
     query: str = Field(
@@ -113,14 +144,17 @@ class JobSearchTool(BaseTool):
             # Transform to simpler format
             simplified_jobs = []
             for job in jobs:
+                description = job.get("job_description") or ""
                 simplified_jobs.append({
                     "job_id": job.get("job_id", ""),
                     "title": job.get("job_title", ""),
-                    "company": job.get("employer_name", ""),
-                    "description": job.get("job_description", "")[:1000],  # Truncate long descriptions
-                    "required_skills": self._extract_skills(job.get("job_description", "")),
-                    "location": job.get("job_city", "") or job.get("job_country", ""),
-                    "employment_type": job.get("job_employment_type", ""),
+                    "company": _intern(job.get("employer_name", "")),
+                    "description": description[:1000],  # Truncate long descriptions
+                    "required_skills": self._extract_skills(
+                        description, description_lower=description.lower()
+                    ),
+                    "location": _intern(job.get("job_city", "") or job.get("job_country", "")),
+                    "employment_type": _intern(job.get("job_employment_type", "")),
                     "url": job.get("job_apply_link", ""),
                     "posted_date": job.get("job_posted_at_datetime_utc", "")
                 })
@@ -132,7 +166,11 @@ class JobSearchTool(BaseTool):
         except Exception as e:
             return [{"error": f"Unexpected error: {str(e)}"}]
     
-    def _extract_skills(self, description: str) -> List[str]:
+    def _extract_skills(
+        self,
+        description: str,
+        description_lower: Optional[str] = None
+    ) -> List[str]:
         """
         Simple skill extraction from job description.
         
@@ -141,25 +179,19 @@ class JobSearchTool(BaseTool):
         
         Args:
             description: Job description text
+            description_lower: Already-lowercased description, if the caller
+                has one (avoids lowercasing the same text again)
         
         Returns:
             List of identified skills
         """
-        # Common tech skills to look for (can be expanded)
-        skill_keywords = [
-            "python", "java", "javascript", "typescript", "react", "angular", "vue",
-            "node.js", "django", "flask", "fastapi", "spring", "kubernetes", "docker",
-            "aws", "azure", "gcp", "sql", "postgresql", "mongodb", "redis",
-            "machine learning", "deep learning", "tensorflow", "pytorch",
-            "git", "ci/cd", "agile", "scrum", "rest api", "graphql"
-        ]
-        
-        description_lower = description.lower()
-        found_skills = []
+        if description_lower is None:
+            description_lower = description.lower()
         
-        for skill in skill_keywords:
-            if skill in description_lower:
-                found_skills.append(skill.title())
+        found_skills = [
+            title for keyword, title in _SKILL_KEYWORDS
+            if keyword in description_lower
+        ]
         
         return found_skills[:10]  # Limit to top 10 skills
 
@@ -187,28 +219,37 @@ def search_jobs_for_candidate(
     tool = JobSearchTool()
     results = tool._run(query=job_title, num_results=num_results, location=location)
     
-    job_postings = []
-    
+    # Map tool output onto JobPosting fields
+    payload = []
     for job_data in results:
         # Skip error entries
         if "error" in job_data:
             print(f"⚠️  Warning: {job_data['error']}")
             continue
         
+        payload.append({
+            "job_id": job_data.get("job_id", "unknown"),
+            "title": job_data.get("title", ""),
+            "company": job_data.get("company", ""),
+            "description": job_data.get("description", ""),
+            "required_skills": job_data.get("required_skills", []),
+            "preferred_skills": [],  # API doesn't distinguish, so empty for now
+            "experience_level": ExperienceLevel.MID,  # Default, could be enhanced with NLP
+            "location": job_data.get("location"),
+            "url": job_data.get("url")
+        })
+    
+    # Validate the whole batch in one pydantic-core call
+    try:
+        return _job_postings_adapter().validate_python(payload)
+    except ValidationError:
+        pass
+    
+    # At least one entry is invalid - validate one by one and skip the bad ones
+    job_postings = []
+    for job_fields in payload:
         try:
-            # Map to JobPosting domain model
-            job_posting = JobPosting(
-                job_id=job_data.get("job_id", "unknown"),
-                title=job_data.get("title", ""),
-                company=job_data.get("company", ""),
-                description=job_data.get("description", ""),
-                required_skills=job_data.get("required_skills", []),
-                preferred_skills=[],  # API doesn't distinguish, so empty for now
-                experience_level=ExperienceLevel.MID,  # Default, could be enhanced with NLP
-                location=job_data.get("location"),
-                url=job_data.get("url")
-            )
-            job_postings.append(job_posting)
+            job_postings.append(JobPosting(**job_fields))
         except Exception as e:
             print(f"⚠️  Failed to parse job: {e}")
             continue
@@ -1,5 +1,17 @@
 # Utils Package
-from .file_parser import extract_resume_text
-from .csv_storage import CandidateStorage
+# Exports are resolved lazily (PEP 562), so importing one utility - e.g.
+# src.utils.csv_storage - doesn't also load the PDF/DOCX parsers.
+import importlib
+
+_EXPORTS = {
+    "extract_resume_text": ".file_parser",
+    "CandidateStorage": ".csv_storage",
+}
 
 __all__ = ["extract_resume_text", "CandidateStorage"]
+
+
+def __getattr__(name):
+    if name in _EXPORTS:
+        return getattr(importlib.import_module(_EXPORTS[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
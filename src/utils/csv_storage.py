@@ -4,13 +4,30 @@ CSV Storage Utility
 Handles saving candidate data and search results to CSV files.
 """
 
+import atexit
 import csv
+import io
 import os
+import threading
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Any
 
 class CandidateStorage:
+    # Header row of each CSV file, written once when the file is created.
+    # The key order gives candidates_file then results_file.
+    _HEADERS = {
+        "candidates.csv": [
+            'timestamp', 'full_name', 'experience_level', 
+            'work_preference', 'location', 'country', 
+            'target_role', 'skills_count', 'total_experience_years'
+        ],
+        "results.csv": [
+            'timestamp', 'candidate_name', 'job_rank', 'company', 
+            'job_title', 'tier', 'score', 'action', 'rationale'
+        ],
+    }
+
     def __init__(self, data_dir: str = "data"):
         """Initialize storage with data directory"""
         # Get project root (3 levels up from src/utils/csv_storage.py)
@@ -20,70 +37,161 @@ class CandidateStorage:
         # Create data directory if it doesn't exist
         self.data_dir.mkdir(parents=True, exist_ok=True)
         
-        self.candidates_file = self.data_dir / "candidates.csv"
-        self.results_file = self.data_dir / "results.csv"
+        # File names come from _HEADERS (candidates first, then results)
+        self.candidates_file, self.results_file = (
+            self.data_dir / name for name in self._HEADERS
+        )
         
         # Initialize files with headers if they don't exist
         self._init_files()
 
+        # Keep both files open for the lifetime of this object (the app shares
+        # one instance across reruns via st.cache_resource). O_APPEND puts
+        # every write at the current end of file, even with other writers.
+        self._candidates_fd = os.open(
+            self.candidates_file, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o666
+        )
+        self._results_fd = os.open(
+            self.results_file, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o666
+        )
+        self._lock = threading.Lock()
+        atexit.register(self.close)
+
+    def close(self):
+        """Close the CSV files (safe to call more than once)"""
+        with self._lock:
+            for fd in (self._candidates_fd, self._results_fd):
+                if fd is not None:
+                    os.close(fd)
+            self._candidates_fd = self._results_fd = None
+
     def _init_files(self):
         """Initialize CSV files with headers"""
-        if not self.candidates_file.exists():
-            with open(self.candidates_file, 'w', newline='', encoding='utf-8') as f:
-                writer = csv.writer(f)
-                writer.writerow([
-                    'timestamp', 'full_name', 'experience_level', 
-                    'work_preference', 'location', 'country', 
-                    'target_role', 'skills_count', 'total_experience_years'
-                ])
-                
-        if not self.results_file.exists():
-            with open(self.results_file, 'w', newline='', encoding='utf-8') as f:
-                writer = csv.writer(f)
-                writer.writerow([
-                    'timestamp', 'candidate_name', 'job_rank', 'company', 
-                    'job_title', 'tier', 'score', 'action', 'rationale'
-                ])
+        for name, header in self._HEADERS.items():
+            self._create_with_header(self.data_dir / name, header)
+
+    @staticmethod
+    def _create_with_header(path: Path, header: List[str]):
+        """Create a CSV file with its header row, unless it already exists"""
+        try:
+            # O_EXCL makes the existence check and the create one atomic step
+            fd = os.open(path, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o666)
+        except FileExistsError:
+            return
+        try:
+            # Plain column names, so no csv quoting is needed
+            os.write(fd, (",".join(header) + "\r\n").encode('utf-8'))
+        finally:
+            os.close(fd)
+
+    @staticmethod
+    def _candidate_row(timestamp, full_name, experience_level, work_preference,
+                       location_preference, country, target_role,
+                       skills_count, total_experience_years) -> List[Any]:
+        """Build a candidates.csv row"""
+        return [
+            timestamp,
+            full_name,
+            experience_level,
+            work_preference,
+            location_preference,
+            country,
+            target_role,
+            skills_count,
+            total_experience_years
+        ]
+
+    @staticmethod
+    def _result_rows(timestamp: str, candidate_name: str,
+                     ranked_jobs: List[Dict[str, Any]]):
+        """Build results.csv rows, one per ranked job"""
+        return (
+            [
+                timestamp,
+                candidate_name,
+                job.get('rank'),
+                job.get('company'),
+                job.get('job_title'),
+                job.get('tier'),
+                job.get('final_score'),
+                job.get('action_recommendation'),
+                job.get('ranking_rationale')
+            ]
+            for job in ranked_jobs
+        )
+
+    def _append(self, fd: int, rows):
+        """
+        Append CSV rows to an open file with a single os.write()
+
+        The rows are formatted in memory first, so a save is one append
+        (no text-layer buffering) and rows from concurrent saves can't
+        interleave.
+        """
+        buffer = io.StringIO()
+        csv.writer(buffer).writerows(rows)
+        data = buffer.getvalue().encode('utf-8')
+
+        with self._lock:
+            written = os.write(fd, data)
+            # Regular files take the whole buffer; finish a short write anyway
+            while written < len(data):
+                written += os.write(fd, data[written:])
+
+    def _append_candidate(self, row: List[Any]):
+        """Append one row to candidates.csv"""
+        self._append(self._candidates_fd, [row])
+
+    def _append_results(self, rows):
+        """Append rows to results.csv"""
+        self._append(self._results_fd, rows)
 
     def save_candidate(self, full_name, experience_level, work_preference, 
                       location_preference, country, target_role, 
                       skills_count, total_experience_years):
         """Save candidate profile to CSV"""
         try:
-            with open(self.candidates_file, 'a', newline='', encoding='utf-8') as f:
-                writer = csv.writer(f)
-                writer.writerow([
-                    datetime.now().isoformat(),
-                    full_name,
-                    experience_level,
-                    work_preference,
-                    location_preference,
-                    country,
-                    target_role,
-                    skills_count,
-                    total_experience_years
-                ])
+            self._append_candidate(self._candidate_row(
+                datetime.now().isoformat(),
+                full_name,
+                experience_level,
+                work_preference,
+                location_preference,
+                country,
+                target_role,
+                skills_count,
+                total_experience_years
+            ))
         except Exception as e:
             print(f"Error saving candidate: {e}")
 
     def save_job_results(self, candidate_name: str, ranked_jobs: List[Dict[str, Any]]):
         """Save job search results to CSV"""
         try:
-            with open(self.results_file, 'a', newline='', encoding='utf-8') as f:
-                writer = csv.writer(f)
-                timestamp = datetime.now().isoformat()
-                
-                for job in ranked_jobs:
-                    writer.writerow([
-                        timestamp,
-                        candidate_name,
-                        job.get('rank'),
-                        job.get('company'),
-                        job.get('job_title'),
-                        job.get('tier'),
-                        job.get('final_score'),
-                        job.get('action_recommendation'),
-                        job.get('ranking_rationale')
-                    ])
+            timestamp = datetime.now().isoformat()
+            self._append_results(self._result_rows(timestamp, candidate_name, ranked_jobs))
+        except Exception as e:
+            print(f"Error saving results: {e}")
+
+    def save_all(self, candidate: Dict[str, Any], ranked_jobs: List[Dict[str, Any]]):
+        """
+        Save a candidate profile and their ranked jobs in one call.
+
+        Args:
+            candidate: save_candidate() keyword arguments
+            ranked_jobs: Ranked job dicts, as passed to save_job_results()
+
+        Both rows share the same timestamp.
+        """
+        timestamp = datetime.now().isoformat()
+        try:
+            self._append_candidate(self._candidate_row(timestamp, **candidate))
+        except Exception as e:
+            print(f"Error saving candidate: {e}")
+
+        try:
+            self._append_results(
+                self._result_rows(timestamp, candidate['full_name'], ranked_jobs)
+            )
         except Exception as e:
             print(f"Error saving results: {e}")
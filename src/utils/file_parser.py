@@ -2,41 +2,101 @@
 File Parser Utility
 
 Handles extraction of text from uploaded resume files (PDF, DOCX).
+
+PDFs are parsed with PyMuPDF (C-backed MuPDF) when it is installed,
+falling back to the pure-Python pypdf reader otherwise.
 """
 
 import io
 from typing import Union
-import pypdf
-import docx
 
-def extract_resume_text(file_obj, filename: str) -> str:
+# pypdf, python-docx and PyMuPDF are imported by the helpers that use them,
+# so importing this module stays cheap and only the needed parser is loaded
+
+# Supported PDF text-extraction backends, fastest first
+PDF_BACKENDS = ("pymupdf", "pypdf")
+
+# Stop reading further pages/paragraphs once this much text is collected;
+# the resume analyst only needs the first few thousand tokens
+MAX_RESUME_CHARS = 30_000
+
+
+def _join_within_budget(texts) -> str:
+    """Join page/paragraph texts, stopping once MAX_RESUME_CHARS is reached"""
+    parts, total = [], 0
+    for text in texts:
+        parts.append(text)
+        total += len(text)
+        if total >= MAX_RESUME_CHARS:
+            break
+    return "\n".join(parts)
+
+
+def _read_bytes(file_obj) -> bytes:
+    """Get the raw bytes of an uploaded file, bytes buffer or file-like object"""
+    if isinstance(file_obj, (bytes, bytearray)):
+        return bytes(file_obj)
+    if hasattr(file_obj, "getvalue"):
+        return file_obj.getvalue()
+    return file_obj.read()
+
+
+def _extract_pdf_pymupdf(file_obj) -> str:
+    """Extract PDF text with PyMuPDF (raises ImportError if not installed)"""
+    import fitz
+
+    with fitz.open(stream=_read_bytes(file_obj), filetype="pdf") as doc:
+        return _join_within_budget(page.get_text("text") for page in doc)
+
+
+def _extract_pdf_pypdf(file_obj) -> str:
+    """Extract PDF text with pypdf"""
+    import pypdf
+
+    pdf_reader = pypdf.PdfReader(file_obj)
+    # extract_text() can return None for pages without a text layer
+    return _join_within_budget(page.extract_text() or "" for page in pdf_reader.pages)
+
+
+def extract_resume_text(file_obj, filename: str, backend: str = "pymupdf") -> str:
     """
     Extract text from an uploaded resume file.
     
     Args:
         file_obj: Streamlit UploadedFile or bytes
         filename: Name of the file with extension
+        backend: PDF backend, "pymupdf" (default) or "pypdf".
+            "pymupdf" falls back to pypdf if PyMuPDF is not installed.
         
     Returns:
-        str: Extracted text content
+        str: Extracted text content (reading stops after the page or
+            paragraph that reaches MAX_RESUME_CHARS)
         
     Raises:
         ValueError: If file format is not supported or extraction fails
     """
+    if backend not in PDF_BACKENDS:
+        raise ValueError(f"Unknown PDF backend: {backend}. Use one of {PDF_BACKENDS}.")
+
     file_ext = filename.lower().split('.')[-1]
-    text = ""
     
     try:
         if file_ext == 'pdf':
-            pdf_reader = pypdf.PdfReader(file_obj)
-            for page in pdf_reader.pages:
-                text += page.extract_text() + "\n"
+            if backend == "pymupdf":
+                try:
+                    text = _extract_pdf_pymupdf(file_obj)
+                except ImportError:
+                    # PyMuPDF not installed - use the pure-Python reader
+                    text = _extract_pdf_pypdf(file_obj)
+            else:
+                text = _extract_pdf_pypdf(file_obj)
                 
         elif file_ext in ['docx', 'doc']:
+            import docx
+
             # python-docx expects a file-like object
             doc = docx.Document(file_obj)
-            for paragraph in doc.paragraphs:
-                text += paragraph.text + "\n"
+            text = _join_within_budget(paragraph.text for paragraph in doc.paragraphs)
                 
         else:
             raise ValueError(f"Unsupported file format: {file_ext}. Please upload PDF or DOCX.")